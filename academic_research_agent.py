@@ -9,7 +9,6 @@ WEEK 1 REFACTORING (2025-11-22): Added circuit breaker protection and resilience
 PHASE 2 COMPLETE (2025-11-23): Refactored to use BaseAgent inheritance
 """
 
-import os
 import sys
 from textwrap import dedent
 
@@ -18,13 +17,14 @@ from agno.db.sqlite import SqliteDb
 from agno.models.openai import OpenAIChat
 
 # Import centralized configuration
-from agent_config import get_db_path
+from agent_config import PROJECT_ROOT, get_db_path
 
 # Import BaseAgent for inheritance pattern
 from base_agent import BaseAgent
 
 # Import resilience infrastructure
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 from src.services.api_tools import (
     create_arxiv_tools_safe,
     build_tools_list,
@@ -32,6 +32,57 @@ from src.services.api_tools import (
 )
 
 
+ACADEMIC_RESEARCH_DESCRIPTION = dedent("""\
+    You are an Academic Research Specialist with access to Arxiv,
+    a repository of academic papers across science, mathematics, computer science,
+    and quantitative fields. You help find cutting-edge research, theoretical
+    studies, and interdisciplinary papers.
+    """)
+
+ACADEMIC_RESEARCH_INSTRUCTIONS = dedent("""\
+    EXPERTISE: Arxiv Academic Paper Search
+
+    SEARCH STRATEGY:
+    1. Search across multiple scientific domains
+    2. Focus on recent preprints and published papers
+    3. Look for interdisciplinary research when relevant
+    4. Include theoretical frameworks and methodologies
+    5. Find systematic approaches and novel techniques
+
+    ARXIV CATEGORIES RELEVANT TO HEALTHCARE:
+    - Computer Science (AI/ML in healthcare)
+    - Statistics (clinical statistics, data analysis)
+    - Quantitative Biology (biological systems)
+    - Physics (medical imaging, biophysics)
+    - Mathematics (epidemiological models)
+
+    RESPONSE FORMAT:
+    For each paper found:
+    - Title and authors
+    - Publication date and Arxiv ID
+    - Abstract summary
+    - Key contributions and findings
+    - Methodology overview
+    - Potential applications to healthcare
+    - Links to full paper
+
+    USE CASES FOR NURSING PROJECT:
+    - Statistical methods for data analysis
+    - Machine learning for patient outcome prediction
+    - Data visualization techniques
+    - Epidemiological modeling
+    - Quality improvement methodologies
+    - Systems analysis approaches
+
+    EXAMPLES OF GOOD SEARCHES:
+    - "Statistical analysis healthcare quality improvement"
+    - "Machine learning patient fall prediction"
+    - "Data analysis methods clinical trials"
+    - "Epidemiological models hospital infections"
+    - "Quality metrics healthcare systems"
+    """)
+
+
 class AcademicResearchAgent(BaseAgent):
     """Academic Research Agent with Arxiv database access."""
 
@@ -69,54 +120,8 @@ class AcademicResearchAgent(BaseAgent):
             role="Search Arxiv for academic research papers",
             model=OpenAIChat(id="gpt-4o"),
             tools=self.tools,
-            description=dedent("""\
-                You are an Academic Research Specialist with access to Arxiv,
-                a repository of academic papers across science, mathematics, computer science,
-                and quantitative fields. You help find cutting-edge research, theoretical
-                studies, and interdisciplinary papers.
-                """),
-            instructions=dedent("""\
-                EXPERTISE: Arxiv Academic Paper Search
-
-                SEARCH STRATEGY:
-                1. Search across multiple scientific domains
-                2. Focus on recent preprints and published papers
-                3. Look for interdisciplinary research when relevant
-                4. Include theoretical frameworks and methodologies
-                5. Find systematic approaches and novel techniques
-
-                ARXIV CATEGORIES RELEVANT TO HEALTHCARE:
-                - Computer Science (AI/ML in healthcare)
-                - Statistics (clinical statistics, data analysis)
-                - Quantitative Biology (biological systems)
-                - Physics (medical imaging, biophysics)
-                - Mathematics (epidemiological models)
-
-                RESPONSE FORMAT:
-                For each paper found:
-                - Title and authors
-                - Publication date and Arxiv ID
-                - Abstract summary
-                - Key contributions and findings
-                - Methodology overview
-                - Potential applications to healthcare
-                - Links to full paper
-
-                USE CASES FOR NURSING PROJECT:
-                - Statistical methods for data analysis
-                - Machine learning for patient outcome prediction
-                - Data visualization techniques
-                - Epidemiological modeling
-                - Quality improvement methodologies
-                - Systems analysis approaches
-
-                EXAMPLES OF GOOD SEARCHES:
-                - "Statistical analysis healthcare quality improvement"
-                - "Machine learning patient fall prediction"
-                - "Data analysis methods clinical trials"
-                - "Epidemiological models hospital infections"
-                - "Quality metrics healthcare systems"
-                """),
+            description=ACADEMIC_RESEARCH_DESCRIPTION,
+            instructions=ACADEMIC_RESEARCH_INSTRUCTIONS,
             add_history_to_context=True,
             add_datetime_to_context=True,
             markdown=True,
@@ -15,9 +15,8 @@ from pathlib import Path
 # Get project root (directory containing this config file)
 PROJECT_ROOT = Path(__file__).parent.resolve()
 
-# Database directory (create if doesn't exist)
+# Database directory (created by ensure_db_directory() at the end of this module)
 DB_DIR = PROJECT_ROOT / "tmp"
-DB_DIR.mkdir(exist_ok=True)
 
 # ============================================================================
 # DATABASE PATHS (Absolute paths for all agents)
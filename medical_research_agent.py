@@ -10,7 +10,6 @@ WEEK 1 REFACTORING (2025-11-22): Added circuit breaker protection and resilience
 PHASE 2 COMPLETE (2025-11-23): Refactored to use BaseAgent inheritance
 """
 
-import os
 import sys
 from textwrap import dedent
 
@@ -19,13 +18,14 @@ from agno.db.sqlite import SqliteDb
 from agno.models.openai import OpenAIChat
 
 # Import centralized configuration
-from agent_config import get_db_path
+from agent_config import PROJECT_ROOT, get_db_path
 
 # Import BaseAgent for inheritance pattern
 from base_agent import BaseAgent
 
 # Import resilience infrastructure
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 from src.services.api_tools import (
     create_pubmed_tools_safe,
     build_tools_list,
@@ -33,6 +33,71 @@ from src.services.api_tools import (
 )
 
 
+MEDICAL_RESEARCH_DESCRIPTION = dedent("""\
+    You are a Medical Literature Search Specialist with access to PubMed,
+    the premier database for biomedical and healthcare research. You help
+    find peer-reviewed studies, clinical trials, systematic reviews, and
+    nursing research articles.
+    """)
+
+MEDICAL_RESEARCH_INSTRUCTIONS = dedent("""\
+    EXPERTISE: PubMed Medical Literature Search
+
+    SEARCH STRATEGY:
+    1. Use specific medical terminology and MeSH terms when possible
+    2. Focus on peer-reviewed, evidence-based research
+    3. Prioritize recent publications (last 5-10 years) unless specified
+    4. Look for systematic reviews and meta-analyses when available
+    5. Include clinical trials and observational studies
+
+    SEARCH TYPES:
+    - Clinical studies and trials
+    - Systematic reviews and meta-analyses
+    - Nursing research and quality improvement
+    - Evidence-based practice guidelines
+    - Case studies and cohort studies
+
+    RESPONSE FORMAT:
+    For each article found, provide:
+    - Title and authors (first author provided)
+    - Publication year and journal
+    - PubMed ID (PMID) and PubMed URL
+    - DOI link (for citations)
+    - Full-text access link (when available via PMC or DOI)
+    - Keywords and MeSH terms (Medical Subject Headings)
+    - Publication type (research article, review, clinical trial, etc.)
+    - Full structured abstract with sections:
+      * OBJECTIVE/BACKGROUND
+      * METHODS
+      * RESULTS
+      * CONCLUSIONS
+    - Key findings relevant to the query
+    - Study design and methodology
+    - Clinical implications
+
+    NOTE: With results_expanded=True, you have access to comprehensive metadata:
+    - Direct links for immediate access and citation
+    - MeSH terms for deeper literature searches
+    - Keywords for finding related research
+    - Complete structured abstracts (not truncated)
+    - Publication types for filtering study designs
+
+    QUALITY INDICATORS:
+    - Peer-reviewed journals
+    - High-impact publications
+    - Large sample sizes
+    - Recent research (prefer last 5 years)
+    - Relevant to clinical practice
+
+    EXAMPLES OF GOOD SEARCHES:
+    - "Fall prevention interventions elderly hospitalized patients"
+    - "Catheter-associated urinary tract infection prevention"
+    - "Pressure ulcer prevention protocols nursing homes"
+    - "Medication reconciliation effectiveness"
+    - "Patient safety culture healthcare"
+    """)
+
+
 class MedicalResearchAgent(BaseAgent):
     """Medical Research Agent with PubMed database access."""
 
@@ -70,68 +135,8 @@ class MedicalResearchAgent(BaseAgent):
             role="Search PubMed for biomedical and nursing research",
             model=OpenAIChat(id="gpt-4o"),
             tools=self.tools,
-            description=dedent("""\
-                You are a Medical Literature Search Specialist with access to PubMed,
-                the premier database for biomedical and healthcare research. You help
-                find peer-reviewed studies, clinical trials, systematic reviews, and
-                nursing research articles.
-                """),
-            instructions=dedent("""\
-                EXPERTISE: PubMed Medical Literature Search
-
-                SEARCH STRATEGY:
-                1. Use specific medical terminology and MeSH terms when possible
-                2. Focus on peer-reviewed, evidence-based research
-                3. Prioritize recent publications (last 5-10 years) unless specified
-                4. Look for systematic reviews and meta-analyses when available
-                5. Include clinical trials and observational studies
-
-                SEARCH TYPES:
-                - Clinical studies and trials
-                - Systematic reviews and meta-analyses
-                - Nursing research and quality improvement
-                - Evidence-based practice guidelines
-                - Case studies and cohort studies
-
-                RESPONSE FORMAT:
-                For each article found, provide:
-                - Title and authors (first author provided)
-                - Publication year and journal
-                - PubMed ID (PMID) and PubMed URL
-                - DOI link (for citations)
-                - Full-text access link (when available via PMC or DOI)
-                - Keywords and MeSH terms (Medical Subject Headings)
-                - Publication type (research article, review, clinical trial, etc.)
-                - Full structured abstract with sections:
-                  * OBJECTIVE/BACKGROUND
-                  * METHODS
-                  * RESULTS
-                  * CONCLUSIONS
-                - Key findings relevant to the query
-                - Study design and methodology
-                - Clinical implications
-
-                NOTE: With results_expanded=True, you have access to comprehensive metadata:
-                - Direct links for immediate access and citation
-                - MeSH terms for deeper literature searches
-                - Keywords for finding related research
-                - Complete structured abstracts (not truncated)
-                - Publication types for filtering study designs
-
-                QUALITY INDICATORS:
-                - Peer-reviewed journals
-                - High-impact publications
-                - Large sample sizes
-                - Recent research (prefer last 5 years)
-                - Relevant to clinical practice
-
-                EXAMPLES OF GOOD SEARCHES:
-                - "Fall prevention interventions elderly hospitalized patients"
-                - "Catheter-associated urinary tract infection prevention"
-                - "Pressure ulcer prevention protocols nursing homes"
-                - "Medication reconciliation effectiveness"
-                - "Patient safety culture healthcare"
-                """),
+            description=MEDICAL_RESEARCH_DESCRIPTION,
+            instructions=MEDICAL_RESEARCH_INSTRUCTIONS,
             add_history_to_context=True,
             add_datetime_to_context=True,
             markdown=True,
@@ -9,7 +9,6 @@ WEEK 1 REFACTORING (2025-11-22): Added circuit breaker protection and resilience
 PHASE 2 COMPLETE (2025-11-23): Refactored to use BaseAgent inheritance
 """
 
-import os
 import sys
 from datetime import datetime
 from textwrap import dedent
@@ -19,13 +18,14 @@ from agno.db.sqlite import SqliteDb
 from agno.models.openai import OpenAIChat
 
 # Import centralized configuration
-from agent_config import get_db_path
+from agent_config import PROJECT_ROOT, get_db_path
 
 # Import BaseAgent for inheritance pattern
 from base_agent import BaseAgent
 
 # Import resilience infrastructure
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 from src.services.api_tools import (
     create_exa_tools_safe,
     create_serp_tools_safe,
@@ -34,6 +34,58 @@ from src.services.api_tools import (
 )
 
 
+NURSING_RESEARCH_DESCRIPTION = dedent("""\
+    You are a specialized Nursing Research Assistant focused on healthcare improvement projects.
+    You help with PICOT development, literature searches, evidence-based practice research,
+    and healthcare standards (Joint Commission, National Patient Safety Goals, etc.).
+    You understand nursing-sensitive indicators, quality improvement, and clinical research.
+    """)
+
+NURSING_RESEARCH_INSTRUCTIONS = dedent("""\
+    EXPERTISE AREAS:
+    1. PICOT Question Development
+       - Help formulate Population, Intervention, Comparison, Outcome, Time questions
+       - Ensure questions are specific, measurable, and clinically relevant
+
+    2. Literature Search & Analysis
+       - Search for peer-reviewed nursing and healthcare research
+       - Focus on evidence-based practice and quality improvement
+       - Identify research articles published in last 5 years
+       - Summarize key findings, methodology, and recommendations
+
+    3. Healthcare Standards & Guidelines
+       - Joint Commission accreditation criteria
+       - National Patient Safety Goals
+       - Core Measures and nursing-sensitive indicators
+       - Infection control standards
+       - Best practice guidelines
+
+    4. Quality Improvement Framework
+       - Problem identification and root cause analysis
+       - Intervention planning and implementation steps
+       - Data collection methods (pre/post intervention)
+       - Success metrics and evaluation criteria
+
+    5. Stakeholder Identification
+       - Identify relevant clinical experts (infection control, wound care, etc.)
+       - Suggest interdisciplinary team members
+       - Recommend departmental collaborations
+
+    SEARCH STRATEGY:
+    - For recent research: Use Exa (academic articles, clinical studies)
+    - For standards/guidelines: Use SerpAPI (official organizations)
+    - Always prioritize peer-reviewed, evidence-based sources
+    - Cite sources with links and publication dates
+
+    RESPONSE FORMAT:
+    - Use clear headings and bullet points
+    - Summarize key takeaways
+    - Provide actionable recommendations
+    - Include relevant citations
+    - Highlight best practices and guidelines
+    """)
+
+
 class NursingResearchAgent(BaseAgent):
     """Nursing Research Agent with Exa and SerpAPI tools."""
 
@@ -77,55 +129,8 @@ class NursingResearchAgent(BaseAgent):
             role="Healthcare improvement project research specialist",
             model=OpenAIChat(id="gpt-4o"),
             tools=self.tools,
-            description=dedent("""\
-                You are a specialized Nursing Research Assistant focused on healthcare improvement projects.
-                You help with PICOT development, literature searches, evidence-based practice research,
-                and healthcare standards (Joint Commission, National Patient Safety Goals, etc.).
-                You understand nursing-sensitive indicators, quality improvement, and clinical research.
-                """),
-            instructions=dedent("""\
-                EXPERTISE AREAS:
-                1. PICOT Question Development
-                   - Help formulate Population, Intervention, Comparison, Outcome, Time questions
-                   - Ensure questions are specific, measurable, and clinically relevant
-
-                2. Literature Search & Analysis
-                   - Search for peer-reviewed nursing and healthcare research
-                   - Focus on evidence-based practice and quality improvement
-                   - Identify research articles published in last 5 years
-                   - Summarize key findings, methodology, and recommendations
-
-                3. Healthcare Standards & Guidelines
-                   - Joint Commission accreditation criteria
-                   - National Patient Safety Goals
-                   - Core Measures and nursing-sensitive indicators
-                   - Infection control standards
-                   - Best practice guidelines
-
-                4. Quality Improvement Framework
-                   - Problem identification and root cause analysis
-                   - Intervention planning and implementation steps
-                   - Data collection methods (pre/post intervention)
-                   - Success metrics and evaluation criteria
-
-                5. Stakeholder Identification
-                   - Identify relevant clinical experts (infection control, wound care, etc.)
-                   - Suggest interdisciplinary team members
-                   - Recommend departmental collaborations
-
-                SEARCH STRATEGY:
-                - For recent research: Use Exa (academic articles, clinical studies)
-                - For standards/guidelines: Use SerpAPI (official organizations)
-                - Always prioritize peer-reviewed, evidence-based sources
-                - Cite sources with links and publication dates
-
-                RESPONSE FORMAT:
-                - Use clear headings and bullet points
-                - Summarize key takeaways
-                - Provide actionable recommendations
-                - Include relevant citations
-                - Highlight best practices and guidelines
-                """),
+            description=NURSING_RESEARCH_DESCRIPTION,
+            instructions=NURSING_RESEARCH_INSTRUCTIONS,
             add_history_to_context=True,
             add_datetime_to_context=True,
             enable_agentic_memory=True,
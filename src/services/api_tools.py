@@ -13,10 +13,14 @@ This module provides safe wrappers for creating API tools that:
 5. Cache API responses (24hr TTL)
 """
 
+import importlib
+import importlib.util
 import logging
 import os
-from typing import Optional, Any, Callable
-from functools import wraps
+import threading
+from types import MappingProxyType
+from typing import Optional, Any, Callable, Dict, Mapping
+from functools import lru_cache, wraps
 
 logger = logging.getLogger(__name__)
 
@@ -39,26 +43,57 @@ except ImportError:
         return func(*args, **kwargs)
 
 # Setup HTTP caching for API responses (24hr TTL)
-try:
-    import requests_cache
-    # Create a cached session with 24hr expiration
-    requests_cache.install_cache(
-        cache_name='api_cache',
-        backend='sqlite',
-        expire_after=86400,  # 24 hours in seconds
-        allowable_codes=[200, 203],
-        allowable_methods=['GET', 'POST'],
-        match_headers=False,
-        ignored_parameters=None,
-    )
-    logger.info("✅ HTTP caching enabled (24hr TTL)")
-    CACHING_ENABLED = True
-except ImportError:
+# requests-cache (and the requests stack it pulls in) is only imported and
+# installed when the first API tool is created, so importing this module
+# stays cheap for agents and scripts that never build a network tool.
+# CACHING_ENABLED stays False until that install has succeeded.
+_REQUESTS_CACHE_AVAILABLE = importlib.util.find_spec("requests_cache") is not None
+CACHING_ENABLED = False
+_http_cache_attempted = False
+_http_cache_lock = threading.Lock()
+
+if not _REQUESTS_CACHE_AVAILABLE:
     logger.warning("requests-cache not installed. API caching disabled. Run: pip install requests-cache")
-    CACHING_ENABLED = False
-except Exception as e:
-    logger.error(f"Failed to setup API caching: {e}")
-    CACHING_ENABLED = False
+
+
+def _ensure_http_cache() -> bool:
+    """
+    Install the global HTTP response cache on first use.
+
+    Returns:
+        True if HTTP caching is enabled
+    """
+    global CACHING_ENABLED, _http_cache_attempted
+
+    if _http_cache_attempted:
+        return CACHING_ENABLED
+
+    with _http_cache_lock:
+        if _http_cache_attempted:
+            return CACHING_ENABLED
+
+        if _REQUESTS_CACHE_AVAILABLE:
+            try:
+                import requests_cache
+                # Create a cached session with 24hr expiration
+                requests_cache.install_cache(
+                    cache_name='api_cache',
+                    backend='sqlite',
+                    expire_after=86400,  # 24 hours in seconds
+                    allowable_codes=[200, 203],
+                    allowable_methods=['GET', 'POST'],
+                    match_headers=False,
+                    ignored_parameters=None,
+                )
+                CACHING_ENABLED = True
+                logger.info("✅ HTTP caching enabled (24hr TTL)")
+            except Exception as e:
+                logger.error(f"Failed to setup API caching: {e}")
+
+        # Only mark the attempt done once CACHING_ENABLED reflects its outcome
+        _http_cache_attempted = True
+
+    return CACHING_ENABLED
 
 
 # ============================================================================
@@ -91,22 +126,32 @@ class CircuitProtectedToolWrapper:
     def __getattr__(self, name):
         """
         Intercept attribute access to wrap methods with circuit breaker.
+
+        Wrapped methods are cached on the instance, so only the first access
+        to each method goes through here.
         """
         # Get the original attribute from the wrapped tool
         attr = getattr(self._tool, name)
 
         # If it's a method, wrap it with circuit breaker
         if callable(attr):
+            breaker = self._breaker
+            tool_name = self._tool_name
+            fallback_message = f"{tool_name} temporarily unavailable. Please try again later."
+
             @wraps(attr)
             def circuit_protected_method(*args, **kwargs):
-                logger.debug(f"Calling {self._tool_name}.{name} with circuit breaker protection")
+                logger.debug("Calling %s.%s with circuit breaker protection", tool_name, name)
                 return call_with_breaker(
-                    self._breaker,
+                    breaker,
                     attr,
-                    f"{self._tool_name} temporarily unavailable. Please try again later.",
+                    fallback_message,
                     *args,
                     **kwargs
                 )
+
+            # Later lookups find the wrapper in __dict__ and skip __getattr__
+            self.__dict__[name] = circuit_protected_method
             return circuit_protected_method
 
         # If it's not a method, return it as-is
@@ -117,6 +162,44 @@ class CircuitProtectedToolWrapper:
 # Safe Tool Creation Functions
 # ============================================================================
 
+# Circuit-protected tools shared by all agents in the process, keyed by tool
+# name plus the settings used to build them (API key / email). Agents that
+# need the same tool reuse one instance instead of rebuilding it.
+_TOOLS_CACHE: Dict[tuple, CircuitProtectedToolWrapper] = {}
+
+# Imported agno tool classes, or the ImportError raised when trying. Python
+# does not remember failed imports, so without this a missing optional
+# dependency would re-run the full sys.path search on every factory call.
+_TOOL_CLASS_CACHE: Dict[tuple, Any] = {}
+
+
+def _import_tool_class(module_name: str, class_name: str) -> Any:
+    """
+    Import an agno tool class once, remembering failures as well as successes.
+
+    Raises:
+        ImportError: If the module or class is unavailable
+    """
+    key = (module_name, class_name)
+    if key not in _TOOL_CLASS_CACHE:
+        try:
+            _TOOL_CLASS_CACHE[key] = getattr(importlib.import_module(module_name), class_name)
+        except ImportError as e:
+            _TOOL_CLASS_CACHE[key] = e
+        except AttributeError:
+            _TOOL_CLASS_CACHE[key] = ImportError(
+                f"cannot import name '{class_name}' from '{module_name}'"
+            )
+
+    cached = _TOOL_CLASS_CACHE[key]
+    if isinstance(cached, ImportError):
+        # Raise a fresh error so repeated raises don't grow one traceback,
+        # chained to the original so its traceback (and the missing
+        # transitive dependency) stays visible
+        raise type(cached)(str(cached), name=cached.name, path=cached.path) from cached
+    return cached
+
+
 def create_exa_tools_safe(required: bool = False) -> Optional[Any]:
     """
     Safely create ExaTools with circuit breaker protection and error handling.
@@ -125,10 +208,10 @@ def create_exa_tools_safe(required: bool = False) -> Optional[Any]:
         required: If True, raises error when API key missing
 
     Returns:
-        Circuit-protected ExaTools instance or None if key missing and not required
+        Circuit-protected ExaTools instance (shared per API key) or None if key missing and not required
     """
     try:
-        from agno.tools.exa import ExaTools
+        ExaTools = _import_tool_class("agno.tools.exa", "ExaTools")
     except ImportError:
         logger.error("agno.tools.exa not available")
         if required:
@@ -144,6 +227,13 @@ def create_exa_tools_safe(required: bool = False) -> Optional[Any]:
             raise ValueError(msg)
         return None
 
+    cache_key = ("exa", api_key)
+    cached_tool = _TOOLS_CACHE.get(cache_key)
+    if cached_tool is not None:
+        return cached_tool
+
+    _ensure_http_cache()
+
     try:
         # Create the base tool
         exa_tool = ExaTools(
@@ -153,6 +243,7 @@ def create_exa_tools_safe(required: bool = False) -> Optional[Any]:
         )
         # Wrap with circuit breaker protection
         wrapped_tool = CircuitProtectedToolWrapper(exa_tool, EXA_BREAKER, "Exa API")
+        _TOOLS_CACHE[cache_key] = wrapped_tool
         logger.info("✅ Created Exa tool with circuit breaker protection")
         return wrapped_tool
     except Exception as e:
@@ -170,10 +261,10 @@ def create_serp_tools_safe(required: bool = False) -> Optional[Any]:
         required: If True, raises error when API key missing
 
     Returns:
-        Circuit-protected SerpApiTools instance or None if key missing and not required
+        Circuit-protected SerpApiTools instance (shared per API key) or None if key missing and not required
     """
     try:
-        from agno.tools.serpapi import SerpApiTools
+        SerpApiTools = _import_tool_class("agno.tools.serpapi", "SerpApiTools")
     except ImportError:
         logger.error("agno.tools.serpapi not available")
         if required:
@@ -189,11 +280,19 @@ def create_serp_tools_safe(required: bool = False) -> Optional[Any]:
             raise ValueError(msg)
         return None
 
+    cache_key = ("serp", api_key)
+    cached_tool = _TOOLS_CACHE.get(cache_key)
+    if cached_tool is not None:
+        return cached_tool
+
+    _ensure_http_cache()
+
     try:
         # Create the base tool
         serp_tool = SerpApiTools(api_key=api_key)
         # Wrap with circuit breaker protection
         wrapped_tool = CircuitProtectedToolWrapper(serp_tool, SERP_BREAKER, "SerpAPI")
+        _TOOLS_CACHE[cache_key] = wrapped_tool
         logger.info("✅ Created SerpAPI tool with circuit breaker protection")
         return wrapped_tool
     except Exception as e:
@@ -211,26 +310,35 @@ def create_pubmed_tools_safe(required: bool = False) -> Optional[Any]:
         required: If True, raises error on failure
 
     Returns:
-        Circuit-protected PubmedTools instance or None on failure
+        Circuit-protected PubmedTools instance (shared per email) or None on failure
     """
     try:
-        from agno.tools.pubmed import PubmedTools
+        PubmedTools = _import_tool_class("agno.tools.pubmed", "PubmedTools")
     except ImportError:
         logger.error("agno.tools.pubmed not available")
         if required:
             raise
         return None
 
+    email = os.getenv("PUBMED_EMAIL", "nursing.research@example.com")
+    cache_key = ("pubmed", email)
+    cached_tool = _TOOLS_CACHE.get(cache_key)
+    if cached_tool is not None:
+        return cached_tool
+
+    _ensure_http_cache()
+
     try:
         # Create the base tool
         pubmed_tool = PubmedTools(
-            email=os.getenv("PUBMED_EMAIL", "nursing.research@example.com"),
+            email=email,
             max_results=10,
             results_expanded=True,
             enable_search_pubmed=True,
         )
         # Wrap with circuit breaker protection
         wrapped_tool = CircuitProtectedToolWrapper(pubmed_tool, PUBMED_BREAKER, "PubMed API")
+        _TOOLS_CACHE[cache_key] = wrapped_tool
         logger.info("✅ Created PubMed tool with circuit breaker protection")
         return wrapped_tool
     except Exception as e:
@@ -248,21 +356,29 @@ def create_arxiv_tools_safe(required: bool = False) -> Optional[Any]:
         required: If True, raises error on failure
 
     Returns:
-        Circuit-protected ArxivTools instance or None on failure
+        Circuit-protected ArxivTools instance (shared) or None on failure
     """
     try:
-        from agno.tools.arxiv import ArxivTools
+        ArxivTools = _import_tool_class("agno.tools.arxiv", "ArxivTools")
     except ImportError:
         logger.error("agno.tools.arxiv not available")
         if required:
             raise
         return None
 
+    cache_key = ("arxiv",)
+    cached_tool = _TOOLS_CACHE.get(cache_key)
+    if cached_tool is not None:
+        return cached_tool
+
+    _ensure_http_cache()
+
     try:
         # Create the base tool
         arxiv_tool = ArxivTools(enable_search_arxiv=True)
         # Wrap with circuit breaker protection
         wrapped_tool = CircuitProtectedToolWrapper(arxiv_tool, ARXIV_BREAKER, "Arxiv API")
+        _TOOLS_CACHE[cache_key] = wrapped_tool
         logger.info("✅ Created Arxiv tool with circuit breaker protection")
         return wrapped_tool
     except Exception as e:
@@ -314,38 +430,60 @@ def validate_tools_list(tools: list, min_required: int = 1) -> bool:
 # Status Reporting
 # ============================================================================
 
-def get_api_status() -> dict:
+@lru_cache(maxsize=None)
+def _build_api_status(
+    openai_key_set: bool,
+    exa_key_set: bool,
+    serp_key_set: bool,
+    pubmed_email_set: bool,
+) -> Mapping[str, Mapping[str, Any]]:
     """
-    Check status of all API keys and services.
+    Build the read-only status mapping for one combination of env settings.
 
-    Returns:
-        Dict with API availability status
+    At most 16 combinations exist, so each is built once and shared.
     """
-    status = {
-        "openai": {
-            "key_set": bool(os.getenv("OPENAI_API_KEY")),
+    return MappingProxyType({
+        "openai": MappingProxyType({
+            "key_set": openai_key_set,
             "required": True,
-        },
-        "exa": {
-            "key_set": bool(os.getenv("EXA_API_KEY")),
+        }),
+        "exa": MappingProxyType({
+            "key_set": exa_key_set,
             "required": False,
-        },
-        "serp": {
-            "key_set": bool(os.getenv("SERP_API_KEY")),
+        }),
+        "serp": MappingProxyType({
+            "key_set": serp_key_set,
             "required": False,
-        },
-        "pubmed": {
-            "email_set": bool(os.getenv("PUBMED_EMAIL")),
+        }),
+        "pubmed": MappingProxyType({
+            "email_set": pubmed_email_set,
             "required": False,
             "note": "PubMed uses email, not API key"
-        },
-        "arxiv": {
+        }),
+        "arxiv": MappingProxyType({
             "key_set": True,  # Arxiv doesn't require key
             "required": False,
             "note": "Arxiv doesn't require authentication"
-        },
-    }
-    return status
+        }),
+    })
+
+
+def get_api_status() -> Mapping[str, Mapping[str, Any]]:
+    """
+    Check status of all API keys and services.
+
+    Environment variables are re-read on every call, but the returned
+    mapping is shared and read-only. Copy it with dict() before modifying.
+
+    Returns:
+        Read-only mapping with API availability status
+    """
+    return _build_api_status(
+        bool(os.getenv("OPENAI_API_KEY")),
+        bool(os.getenv("EXA_API_KEY")),
+        bool(os.getenv("SERP_API_KEY")),
+        bool(os.getenv("PUBMED_EMAIL")),
+    )
 
 
 def print_api_status():
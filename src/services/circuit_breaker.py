@@ -16,8 +16,11 @@ Configuration:
 - Expected exceptions: RequestException, APIError, Timeout
 """
 
+import asyncio
 import logging
-from typing import Callable, Any, Optional
+import threading
+from types import MappingProxyType
+from typing import Callable, Any, Dict, Iterable, List, Mapping, Optional, Union
 from functools import wraps
 
 try:
@@ -44,17 +47,18 @@ class LoggingListener(CircuitBreakerListener):
         self.timeout = timeout
 
     def success(self, cb):
-        logger.debug(f"Circuit breaker '{cb.name}' - successful call")
+        logger.debug("Circuit breaker '%s' - successful call", cb.name)
 
     def failure(self, cb, exc):
-        logger.warning(f"Circuit breaker '{cb.name}' - failure: {exc}")
+        logger.warning("Circuit breaker '%s' - failure: %s", cb.name, exc)
 
     def state_change(self, cb, old_state, new_state):
-        logger.warning(f"Circuit breaker '{cb.name}' - state change: {old_state} → {new_state}")
+        logger.warning("Circuit breaker '%s' - state change: %s → %s", cb.name, old_state, new_state)
         if str(new_state) == "open":
             logger.error(
-                f"🔴 API '{cb.name}' circuit OPEN - too many failures. "
-                f"Will retry in {self.timeout} seconds."
+                "🔴 API '%s' circuit OPEN - too many failures. "
+                "Will retry in %s seconds.",
+                cb.name, self.timeout
             )
 
 
@@ -95,12 +99,92 @@ def create_circuit_breaker(name: str, failure_threshold: int = 5, timeout: int =
     return breaker
 
 
-# Create circuit breakers for each external API
-OPENAI_BREAKER = create_circuit_breaker("OpenAI API", failure_threshold=5, timeout=60)
-EXA_BREAKER = create_circuit_breaker("Exa API", failure_threshold=5, timeout=60)
-SERP_BREAKER = create_circuit_breaker("SerpAPI", failure_threshold=5, timeout=60)
-PUBMED_BREAKER = create_circuit_breaker("PubMed API", failure_threshold=5, timeout=60)
-ARXIV_BREAKER = create_circuit_breaker("Arxiv API", failure_threshold=5, timeout=60)
+class _LazyBreaker:
+    """
+    Proxy that defers creating a circuit breaker until it is first used.
+
+    Scripts and tests that only touch one API should not pay for building
+    (and registering listeners on) breakers for every other API. The real
+    CircuitBreaker is created on first attribute access and cached.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, timeout: int = 60):
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._timeout = timeout
+        self._breaker = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_initialized(self) -> bool:
+        """True once the underlying CircuitBreaker has been created."""
+        return self._breaker is not None
+
+    @property
+    def failure_threshold(self) -> int:
+        """Failures before the circuit opens (available without building it)."""
+        return self._failure_threshold
+
+    def _get_breaker(self):
+        if self._breaker is None:
+            with self._lock:
+                if self._breaker is None:
+                    self._breaker = create_circuit_breaker(
+                        self.name,
+                        failure_threshold=self._failure_threshold,
+                        timeout=self._timeout,
+                    )
+        return self._breaker
+
+    def __getattr__(self, attr):
+        # Only called for attributes not set on the proxy itself. Private
+        # names are never proxied: copy/pickle probe them on instances that
+        # skipped __init__, where reading self._breaker would recurse.
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        return getattr(self._get_breaker(), attr)
+
+    def __call__(self, *args, **kwargs):
+        # Dunder lookups bypass __getattr__, so delegate decorator use
+        # (@EXA_BREAKER) to the real breaker explicitly
+        return self._get_breaker()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        state = "initialized" if self.is_initialized else "pending"
+        return f"<_LazyBreaker {self.name!r} ({state})>"
+
+
+# A real pybreaker CircuitBreaker or a lazy proxy for one
+Breaker = Union["CircuitBreaker", _LazyBreaker]
+
+
+def create_lazy_circuit_breaker(
+    name: str, failure_threshold: int = 5, timeout: int = 60
+) -> Optional[_LazyBreaker]:
+    """
+    Create a circuit breaker that is only built on first use.
+
+    Args:
+        name: Name of the API (for logging)
+        failure_threshold: Number of failures before opening circuit
+        timeout: Seconds to wait before attempting recovery
+
+    Returns:
+        Lazy circuit breaker proxy or None if pybreaker not available
+    """
+    if CircuitBreaker is None:
+        logger.warning(f"Circuit breaker for {name} not created (pybreaker not installed)")
+        return None
+
+    return _LazyBreaker(name, failure_threshold=failure_threshold, timeout=timeout)
+
+
+# Create circuit breakers for each external API (built on first use)
+OPENAI_BREAKER = create_lazy_circuit_breaker("OpenAI API", failure_threshold=5, timeout=60)
+EXA_BREAKER = create_lazy_circuit_breaker("Exa API", failure_threshold=5, timeout=60)
+SERP_BREAKER = create_lazy_circuit_breaker("SerpAPI", failure_threshold=5, timeout=60)
+PUBMED_BREAKER = create_lazy_circuit_breaker("PubMed API", failure_threshold=5, timeout=60)
+ARXIV_BREAKER = create_lazy_circuit_breaker("Arxiv API", failure_threshold=5, timeout=60)
 
 
 # ============================================================================
@@ -108,7 +192,7 @@ ARXIV_BREAKER = create_circuit_breaker("Arxiv API", failure_threshold=5, timeout
 # ============================================================================
 
 def with_circuit_breaker(
-    breaker: Optional[CircuitBreaker],
+    breaker: Optional[Breaker],
     fallback_message: str = "Service temporarily unavailable. Please try again later."
 ):
     """
@@ -140,15 +224,19 @@ def with_circuit_breaker(
             except CircuitBreakerError:
                 # Circuit is OPEN - too many failures
                 logger.error(
-                    f"Circuit breaker '{breaker.name}' is OPEN. "
-                    f"Returning fallback message."
+                    "Circuit breaker '%s' is OPEN. "
+                    "Returning fallback message.",
+                    breaker.name
                 )
                 # Return fallback instead of crashing
                 return {"error": "service_unavailable", "message": fallback_message}
 
             except Exception as e:
-                # Other exceptions - log and re-raise
-                logger.error(f"Error in circuit-protected call: {e}", exc_info=True)
+                # Other exceptions - log and re-raise. The caller gets the
+                # traceback with the exception, so only format it at DEBUG
+                # (this path runs on every failure while a breaker trips).
+                logger.error("Error in circuit-protected call: %s: %s", type(e).__name__, e)
+                logger.debug("Circuit-protected call traceback", exc_info=True)
                 raise
 
         return wrapper
@@ -156,7 +244,7 @@ def with_circuit_breaker(
 
 
 def call_with_breaker(
-    breaker: Optional[CircuitBreaker],
+    breaker: Optional[Breaker],
     func: Callable,
     fallback_message: str,
     *args,
@@ -187,7 +275,7 @@ def call_with_breaker(
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            logger.error(f"Error calling function (no breaker): {e}")
+            logger.error("Error calling function (no breaker): %s", e)
             return {"error": "api_error", "message": fallback_message}
 
     try:
@@ -195,40 +283,172 @@ def call_with_breaker(
     except CircuitBreakerError:
         # Circuit is OPEN - return fallback
         logger.error(
-            f"Circuit breaker '{breaker.name}' is OPEN. "
-            f"Returning fallback."
+            "Circuit breaker '%s' is OPEN. "
+            "Returning fallback.",
+            breaker.name
         )
         return {"error": "service_unavailable", "message": fallback_message}
     except Exception as e:
         # API call failed but circuit not yet open - return fallback
-        logger.error(f"Error in circuit-protected call to '{breaker.name}': {e}")
+        logger.error("Error in circuit-protected call to '%s': %s", breaker.name, e)
         return {"error": "api_error", "message": fallback_message}
 
 
-def get_breaker_status(breaker: Optional[CircuitBreaker]) -> dict:
+async def call_with_breaker_async(
+    breaker: Optional[Breaker],
+    func: Callable,
+    fallback_message: str,
+    *args,
+    **kwargs
+) -> Any:
+    """
+    Async version of call_with_breaker for blocking API calls.
+
+    The blocking call (and the breaker bookkeeping around it) runs in a
+    worker thread via asyncio.to_thread, so the event loop stays responsive
+    and several API calls can be awaited concurrently. Library-only helper
+    for async callers; the agents call their tools synchronously through agno.
+
+    Args:
+        breaker: Circuit breaker to use
+        func: Blocking function to call
+        fallback_message: Message if circuit is open
+        *args, **kwargs: Arguments to pass to func
+
+    Returns:
+        Result of func() or fallback dict if circuit open or error
+
+    Example:
+        result = await call_with_breaker_async(
+            PUBMED_BREAKER,
+            pubmed_tool.search_pubmed,
+            "PubMed search unavailable",
+            query="fall prevention"
+        )
+    """
+    return await asyncio.to_thread(
+        call_with_breaker, breaker, func, fallback_message, *args, **kwargs
+    )
+
+
+async def call_many_with_breaker_async(
+    breaker: Optional[Breaker],
+    func: Callable,
+    fallback_message: str,
+    arg_list: Iterable[tuple],
+    max_concurrency: int = 8
+) -> List[Any]:
+    """
+    Run several circuit-protected calls concurrently.
+
+    Each call goes through call_with_breaker_async, so network round trips
+    overlap and total time is close to the slowest call rather than the sum.
+    A failed call yields its fallback dict without cancelling the others,
+    and an open circuit fails the whole batch after a single probe call.
+
+    Args:
+        breaker: Circuit breaker to use
+        func: Blocking function to call
+        fallback_message: Message if circuit is open
+        arg_list: One tuple of positional arguments per call
+        max_concurrency: Maximum calls in flight at once
+
+    Returns:
+        Results (or fallback dicts) in the same order as arg_list
+
+    Raises:
+        ValueError: If max_concurrency is less than 1
+
+    Note:
+        Library-only helper for async callers; the agents themselves call
+        their tools synchronously through agno and do not use it.
+
+    Example:
+        results = await call_many_with_breaker_async(
+            ARXIV_BREAKER,
+            arxiv_tool.search_arxiv_and_return_articles,
+            "Arxiv search unavailable",
+            [("fall prevention",), ("pressure injury",)]
+        )
+    """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+    arg_list = list(arg_list)
+    if not arg_list:
+        return []
+
+    # If the circuit is open, probe it with the first call only. While the
+    # reset timeout is running (or the half-open trial fails) every other
+    # call would just raise CircuitBreakerError, so fail the batch at once.
+    results = []
+    if breaker is not None and breaker.current_state == "open":
+        results.append(
+            await call_with_breaker_async(breaker, func, fallback_message, *arg_list[0])
+        )
+        arg_list = arg_list[1:]
+        if breaker.current_state == "open":
+            logger.error(
+                "Circuit breaker '%s' is OPEN. "
+                "Returning fallback for %d batched calls.",
+                breaker.name, len(arg_list)
+            )
+            return results + [
+                {"error": "service_unavailable", "message": fallback_message}
+                for _ in arg_list
+            ]
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded_call(args: tuple) -> Any:
+        async with semaphore:
+            return await call_with_breaker_async(breaker, func, fallback_message, *args)
+
+    return results + await asyncio.gather(*(bounded_call(args) for args in arg_list))
+
+
+# Shared read-only status for APIs without a circuit breaker
+_DISABLED_STATUS = MappingProxyType({"available": False, "state": "disabled"})
+
+
+def get_breaker_status(breaker: Optional[Breaker]) -> Mapping[str, Any]:
     """
     Get current status of a circuit breaker.
 
+    The result is read-only (the disabled status is shared between calls).
+    Copy it with dict() before modifying.
+
     Args:
         breaker: Circuit breaker to check
 
     Returns:
-        Dict with status info
+        Read-only mapping with status info
     """
     if breaker is None:
-        return {"available": False, "state": "disabled"}
-
-    return {
+        return _DISABLED_STATUS
+
+    # Unused lazy breakers report their initial state without being built
+    if isinstance(breaker, _LazyBreaker) and not breaker.is_initialized:
+        return MappingProxyType({
+            "available": True,
+            "name": breaker.name,
+            "state": "closed",
+            "failure_count": 0,
+            "failure_threshold": breaker.failure_threshold,
+            "opened_at": None,
+        })
+
+    return MappingProxyType({
         "available": True,
         "name": breaker.name,
         "state": breaker.current_state,
         "failure_count": breaker.fail_counter,
         "failure_threshold": breaker.fail_max,
         "opened_at": breaker.opened_at if hasattr(breaker, 'opened_at') else None,
-    }
+    })
 
 
-def reset_breaker(breaker: Optional[CircuitBreaker]) -> bool:
+def reset_breaker(breaker: Optional[Breaker]) -> bool:
     """
     Manually reset a circuit breaker (for testing/debugging).
 
@@ -254,12 +474,12 @@ def reset_breaker(breaker: Optional[CircuitBreaker]) -> bool:
 # Status Check Functions
 # ============================================================================
 
-def get_all_breaker_status() -> dict:
+def get_all_breaker_status() -> Dict[str, Mapping[str, Any]]:
     """
     Get status of all circuit breakers.
 
     Returns:
-        Dict mapping API name to status
+        Dict mapping API name to its read-only status (see get_breaker_status)
     """
     return {
         "openai": get_breaker_status(OPENAI_BREAKER),
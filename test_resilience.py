@@ -89,20 +89,14 @@ def test_api_tools():
             create_arxiv_tools_safe,
             get_api_status,
             print_api_status,
-            CACHING_ENABLED
         )
+        from src.services import api_tools
 
         print("\n✅ API tools module imported successfully")
 
         # Show API configuration status
         print_api_status()
 
-        # Show caching status
-        if CACHING_ENABLED:
-            print("✅ HTTP caching is enabled (24hr TTL)\n")
-        else:
-            print("⚠️  HTTP caching is disabled (requests-cache not available)\n")
-
         # Test tool creation
         print("Testing safe tool creation...\n")
 
@@ -112,6 +106,12 @@ def test_api_tools():
         arxiv = create_arxiv_tools_safe()
         print(f"  Arxiv tool: {'✅ Created' if arxiv else '❌ Failed'}")
 
+        # Show caching status (installed when the first tool is created)
+        if api_tools.CACHING_ENABLED:
+            print("\n✅ HTTP caching is enabled (24hr TTL)")
+        else:
+            print("\n⚠️  HTTP caching is disabled (requests-cache not available or failed to install)")
+
         print("\n✅ API tools testing complete")
         return True
 
@@ -65,6 +65,20 @@ class TestCreateAgent:
 
         mock_get_db.assert_called_with("academic_research")
 
+    @patch('academic_research_agent.Agent')
+    @patch('academic_research_agent.create_arxiv_tools_safe', return_value=None)
+    @patch('academic_research_agent.build_tools_list', return_value=[])
+    def test_create_agent_uses_module_prompts(self, mock_build, mock_arxiv, mock_agent):
+        """Test that the prompt text is the shared module-level constant"""
+        import academic_research_agent
+
+        agent = AcademicResearchAgent()
+        call_kwargs = mock_agent.call_args.kwargs
+
+        assert call_kwargs['description'] is academic_research_agent.ACADEMIC_RESEARCH_DESCRIPTION
+        assert call_kwargs['instructions'] is academic_research_agent.ACADEMIC_RESEARCH_INSTRUCTIONS
+        assert "Arxiv" in call_kwargs['instructions']
+
 
 class TestAcademicResearchAgentIntegration:
     """Integration tests for AcademicResearchAgent"""
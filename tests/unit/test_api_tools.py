@@ -0,0 +1,321 @@
+"""
+Unit tests for src/services/api_tools.py
+Tests API status reporting and tool wrapper helpers
+"""
+
+import importlib
+import sys
+import threading
+import pytest
+from unittest.mock import Mock, MagicMock, patch
+
+
+def _import_real_services():
+    """
+    Import the real src.services modules as a package.
+
+    Other test modules replace `src` in sys.modules with a MagicMock before
+    importing their agents. Swap the real packages in for this import (so
+    api_tools' relative circuit_breaker import resolves) and then restore
+    whatever was there before.
+    """
+    names = ["src", "src.services", "src.services.circuit_breaker", "src.services.api_tools"]
+    saved = {name: sys.modules.pop(name) for name in names if name in sys.modules}
+    try:
+        return (
+            importlib.import_module("src.services.api_tools"),
+            importlib.import_module("src.services.circuit_breaker"),
+        )
+    finally:
+        for name in names:
+            sys.modules.pop(name, None)
+        sys.modules.update(saved)
+
+
+api_tools, circuit_breaker = _import_real_services()
+
+
+class TestGetApiStatus:
+    """Test the get_api_status function"""
+
+    def test_reflects_environment(self, monkeypatch):
+        """Test that key availability follows environment variables"""
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        monkeypatch.delenv("EXA_API_KEY", raising=False)
+        monkeypatch.setenv("SERP_API_KEY", "serp-test")
+        monkeypatch.delenv("PUBMED_EMAIL", raising=False)
+
+        status = api_tools.get_api_status()
+
+        assert status["openai"]["key_set"] is True
+        assert status["exa"]["key_set"] is False
+        assert status["serp"]["key_set"] is True
+        assert status["pubmed"]["email_set"] is False
+        assert status["arxiv"]["key_set"] is True
+
+    def test_picks_up_environment_changes(self, monkeypatch):
+        """Test that status is not frozen at first call"""
+        monkeypatch.delenv("EXA_API_KEY", raising=False)
+        assert api_tools.get_api_status()["exa"]["key_set"] is False
+
+        monkeypatch.setenv("EXA_API_KEY", "exa-test")
+        assert api_tools.get_api_status()["exa"]["key_set"] is True
+
+    def test_repeated_calls_share_mapping(self, monkeypatch):
+        """Test that unchanged settings return the same object"""
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+
+        assert api_tools.get_api_status() is api_tools.get_api_status()
+
+    def test_status_is_read_only(self):
+        """Test that callers cannot mutate the shared status"""
+        status = api_tools.get_api_status()
+
+        with pytest.raises(TypeError):
+            status["openai"] = {}
+        with pytest.raises(TypeError):
+            status["openai"]["key_set"] = True
+
+
+class TestCircuitProtectedToolWrapper:
+    """Test the CircuitProtectedToolWrapper class"""
+
+    def test_uses_real_circuit_breaker_module(self):
+        """Test that the module was imported with its real breakers"""
+        assert api_tools.call_with_breaker is circuit_breaker.call_with_breaker
+        assert api_tools.EXA_BREAKER is circuit_breaker.EXA_BREAKER
+
+    def test_method_calls_return_tool_result(self):
+        """Test that wrapped methods pass through to the tool"""
+        tool = Mock()
+        tool.search.return_value = "results"
+        wrapper = api_tools.CircuitProtectedToolWrapper(tool, None, "Test API")
+
+        assert wrapper.search("falls") == "results"
+        tool.search.assert_called_once_with("falls")
+
+    def test_wrapped_method_is_cached(self):
+        """Test that repeated lookups reuse the same wrapper"""
+        wrapper = api_tools.CircuitProtectedToolWrapper(Mock(), None, "Test API")
+
+        first = wrapper.search
+        assert wrapper.search is first
+        assert "search" in wrapper.__dict__
+
+    def test_passes_breaker_and_fallback_message(self):
+        """Test that calls carry the tool's breaker and fallback message"""
+        tool = Mock()
+        breaker = Mock(name="breaker")
+        wrapper = api_tools.CircuitProtectedToolWrapper(tool, breaker, "Test API")
+
+        with patch.object(api_tools, "call_with_breaker") as mock_call:
+            wrapper.search("falls")
+
+        args = mock_call.call_args.args
+        assert args[0] is breaker
+        assert args[1] is tool.search
+        assert args[2] == "Test API temporarily unavailable. Please try again later."
+        assert args[3] == "falls"
+
+    def test_non_callable_attributes_pass_through(self):
+        """Test that plain attributes are returned as-is"""
+        tool = Mock()
+        tool.max_results = 10
+        wrapper = api_tools.CircuitProtectedToolWrapper(tool, None, "Test API")
+
+        assert wrapper.max_results == 10
+
+
+@pytest.mark.skipif(circuit_breaker.CircuitBreaker is None, reason="pybreaker not installed")
+class TestWrapperWithRealBreaker:
+    """Test wrapped tool calls against a real circuit breaker"""
+
+    def test_open_circuit_returns_fallback(self):
+        """Test that an open circuit short-circuits the tool call"""
+        breaker = circuit_breaker.create_circuit_breaker("Test API", failure_threshold=1, timeout=60)
+        tool = Mock()
+        tool.search.side_effect = RuntimeError("down")
+        wrapper = api_tools.CircuitProtectedToolWrapper(tool, breaker, "Test API")
+
+        wrapper.search("falls")
+        assert breaker.current_state == "open"
+        tool.search.reset_mock()
+
+        result = wrapper.search("falls")
+
+        assert result == {
+            "error": "service_unavailable",
+            "message": "Test API temporarily unavailable. Please try again later.",
+        }
+        tool.search.assert_not_called()
+
+
+class TestEnsureHttpCache:
+    """Test lazy installation of the HTTP response cache"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache_state(self, monkeypatch):
+        monkeypatch.setattr(api_tools, "CACHING_ENABLED", False)
+        monkeypatch.setattr(api_tools, "_http_cache_attempted", False)
+
+    def test_installs_once(self, monkeypatch):
+        """Test that the cache is installed on first use only"""
+        fake_requests_cache = MagicMock()
+        monkeypatch.setitem(sys.modules, "requests_cache", fake_requests_cache)
+        monkeypatch.setattr(api_tools, "_REQUESTS_CACHE_AVAILABLE", True)
+
+        assert api_tools.CACHING_ENABLED is False
+        assert api_tools._ensure_http_cache() is True
+        assert api_tools._ensure_http_cache() is True
+        assert api_tools.CACHING_ENABLED is True
+
+        fake_requests_cache.install_cache.assert_called_once()
+        assert fake_requests_cache.install_cache.call_args.kwargs["expire_after"] == 86400
+
+    def test_skips_when_requests_cache_missing(self, monkeypatch):
+        """Test that nothing is imported when requests-cache is unavailable"""
+        fake_requests_cache = MagicMock()
+        monkeypatch.setitem(sys.modules, "requests_cache", fake_requests_cache)
+        monkeypatch.setattr(api_tools, "_REQUESTS_CACHE_AVAILABLE", False)
+
+        assert api_tools._ensure_http_cache() is False
+        fake_requests_cache.install_cache.assert_not_called()
+
+    def test_install_failure_disables_caching(self, monkeypatch):
+        """Test that a failed install is reported and not retried"""
+        fake_requests_cache = MagicMock()
+        fake_requests_cache.install_cache.side_effect = OSError("read-only filesystem")
+        monkeypatch.setitem(sys.modules, "requests_cache", fake_requests_cache)
+        monkeypatch.setattr(api_tools, "_REQUESTS_CACHE_AVAILABLE", True)
+
+        assert api_tools._ensure_http_cache() is False
+        assert api_tools._ensure_http_cache() is False
+        assert api_tools.CACHING_ENABLED is False
+        fake_requests_cache.install_cache.assert_called_once()
+
+    def test_concurrent_callers_wait_for_install(self, monkeypatch):
+        """Test that no caller sees a result before the install finishes"""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_install(**kwargs):
+            started.set()
+            release.wait(timeout=5)
+
+        fake_requests_cache = MagicMock()
+        fake_requests_cache.install_cache.side_effect = slow_install
+        monkeypatch.setitem(sys.modules, "requests_cache", fake_requests_cache)
+        monkeypatch.setattr(api_tools, "_REQUESTS_CACHE_AVAILABLE", True)
+
+        first = threading.Thread(target=api_tools._ensure_http_cache)
+        first.start()
+        assert started.wait(timeout=5)
+
+        results = []
+        second = threading.Thread(target=lambda: results.append(api_tools._ensure_http_cache()))
+        second.start()
+        second.join(timeout=0.1)
+        assert results == []
+
+        release.set()
+        first.join(timeout=5)
+        second.join(timeout=5)
+        assert results == [True]
+        fake_requests_cache.install_cache.assert_called_once()
+
+
+class TestToolReuse:
+    """Test that safe tool factories share instances across agents"""
+
+    @pytest.fixture(autouse=True)
+    def isolated_cache(self, monkeypatch):
+        monkeypatch.setattr(api_tools, "_TOOLS_CACHE", {})
+        monkeypatch.setattr(api_tools, "_TOOL_CLASS_CACHE", {})
+        monkeypatch.setattr(api_tools, "_ensure_http_cache", Mock(return_value=False))
+
+    def test_arxiv_tool_built_once(self, monkeypatch):
+        """Test that repeated calls return the same wrapped tool"""
+        fake_module = MagicMock()
+        monkeypatch.setitem(sys.modules, "agno.tools.arxiv", fake_module)
+
+        first = api_tools.create_arxiv_tools_safe()
+        second = api_tools.create_arxiv_tools_safe()
+
+        assert first is second
+        fake_module.ArxivTools.assert_called_once()
+
+    def test_exa_tool_rebuilt_for_new_key(self, monkeypatch):
+        """Test that a different API key gets its own tool"""
+        fake_module = MagicMock()
+        monkeypatch.setitem(sys.modules, "agno.tools.exa", fake_module)
+
+        monkeypatch.setenv("EXA_API_KEY", "key-one")
+        first = api_tools.create_exa_tools_safe()
+        monkeypatch.setenv("EXA_API_KEY", "key-two")
+        second = api_tools.create_exa_tools_safe()
+
+        assert first is not second
+        assert fake_module.ExaTools.call_count == 2
+
+    def test_failed_creation_not_cached(self, monkeypatch):
+        """Test that a failed build is retried on the next call"""
+        fake_module = MagicMock()
+        fake_module.PubmedTools.side_effect = [RuntimeError("boom"), Mock()]
+        monkeypatch.setitem(sys.modules, "agno.tools.pubmed", fake_module)
+
+        assert api_tools.create_pubmed_tools_safe() is None
+        assert api_tools.create_pubmed_tools_safe() is not None
+
+
+class TestImportToolClass:
+    """Test cached imports of optional agno tool classes"""
+
+    @pytest.fixture(autouse=True)
+    def isolated_cache(self, monkeypatch):
+        monkeypatch.setattr(api_tools, "_TOOL_CLASS_CACHE", {})
+
+    def test_success_is_cached(self, monkeypatch):
+        """Test that the module is imported once and the class reused"""
+        fake_module = MagicMock()
+        monkeypatch.setitem(sys.modules, "agno.tools.arxiv", fake_module)
+
+        with patch.object(api_tools.importlib, "import_module",
+                          wraps=api_tools.importlib.import_module) as mock_import:
+            first = api_tools._import_tool_class("agno.tools.arxiv", "ArxivTools")
+            second = api_tools._import_tool_class("agno.tools.arxiv", "ArxivTools")
+
+        assert first is second is fake_module.ArxivTools
+        mock_import.assert_called_once_with("agno.tools.arxiv")
+
+    def test_failure_is_cached(self):
+        """Test that a missing dependency is not re-probed on every call"""
+        with patch.object(api_tools.importlib, "import_module",
+                          side_effect=ImportError("No module named 'exa_py'")) as mock_import:
+            for _ in range(3):
+                with pytest.raises(ImportError, match="exa_py"):
+                    api_tools._import_tool_class("agno.tools.exa", "ExaTools")
+
+        mock_import.assert_called_once()
+
+    def test_cached_failure_keeps_type_and_cause(self):
+        """Test that re-raised errors keep the subclass and chain the original"""
+        original = ModuleNotFoundError("No module named 'exa_py'", name="exa_py", path="/site")
+        with patch.object(api_tools.importlib, "import_module", side_effect=original):
+            with pytest.raises(ModuleNotFoundError) as first:
+                api_tools._import_tool_class("agno.tools.exa", "ExaTools")
+        with pytest.raises(ModuleNotFoundError) as second:
+            api_tools._import_tool_class("agno.tools.exa", "ExaTools")
+
+        for raised in (first.value, second.value):
+            assert raised is not original
+            assert raised.__cause__ is original
+            assert raised.name == "exa_py"
+            assert raised.path == "/site"
+
+    def test_missing_dependency_returns_none_unless_required(self):
+        """Test that factories keep their optional/required semantics"""
+        api_tools._TOOL_CLASS_CACHE[("agno.tools.arxiv", "ArxivTools")] = ImportError("missing")
+
+        assert api_tools.create_arxiv_tools_safe() is None
+        with pytest.raises(ImportError):
+            api_tools.create_arxiv_tools_safe(required=True)
@@ -0,0 +1,342 @@
+"""
+Unit tests for src/services/circuit_breaker.py
+Tests lazy breaker creation, protected calls and status reporting
+"""
+
+import asyncio
+import copy
+import importlib.util
+import threading
+import time
+import pytest
+from pathlib import Path
+from unittest.mock import Mock, MagicMock, patch
+
+# Other test modules replace the `src` package with a MagicMock before
+# importing their agents, so load the real module straight from its file.
+_MODULE_PATH = Path(__file__).resolve().parents[2] / "src" / "services" / "circuit_breaker.py"
+_spec = importlib.util.spec_from_file_location("circuit_breaker_under_test", _MODULE_PATH)
+circuit_breaker = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(circuit_breaker)
+
+
+@pytest.fixture
+def fake_pybreaker():
+    """Patch in a fake CircuitBreaker class so tests don't need pybreaker."""
+    fake_cls = MagicMock(name="CircuitBreaker")
+    fake_cls.side_effect = lambda **kwargs: Mock(**kwargs)
+    with patch.object(circuit_breaker, "CircuitBreaker", fake_cls), \
+         patch.object(circuit_breaker, "CircuitBreakerListener", None):
+        yield fake_cls
+
+
+class TestLazyBreaker:
+    """Test the _LazyBreaker proxy"""
+
+    def test_not_built_until_used(self, fake_pybreaker):
+        """Test that creating the proxy does not build a CircuitBreaker"""
+        breaker = circuit_breaker.create_lazy_circuit_breaker("Test API")
+
+        assert breaker is not None
+        assert not breaker.is_initialized
+        fake_pybreaker.assert_not_called()
+
+    def test_built_once_on_first_attribute_access(self, fake_pybreaker):
+        """Test that the real breaker is created once and then reused"""
+        breaker = circuit_breaker.create_lazy_circuit_breaker(
+            "Test API", failure_threshold=3, timeout=10
+        )
+
+        breaker.call
+        breaker.current_state
+
+        fake_pybreaker.assert_called_once()
+        kwargs = fake_pybreaker.call_args.kwargs
+        assert kwargs["fail_max"] == 3
+        assert kwargs["reset_timeout"] == 10
+        assert kwargs["name"] == "Test API"
+        assert breaker.is_initialized
+
+    def test_name_does_not_trigger_creation(self, fake_pybreaker):
+        """Test that reading the name is served by the proxy itself"""
+        breaker = circuit_breaker.create_lazy_circuit_breaker("Test API")
+
+        assert breaker.name == "Test API"
+        fake_pybreaker.assert_not_called()
+
+    def test_private_names_are_not_proxied(self, fake_pybreaker):
+        """Test that missing private attributes raise without building"""
+        breaker = circuit_breaker.create_lazy_circuit_breaker("Test API")
+
+        with pytest.raises(AttributeError):
+            breaker._state
+        fake_pybreaker.assert_not_called()
+
+    def test_copy_does_not_recurse(self, fake_pybreaker):
+        """Test that copying an unused proxy works"""
+        breaker = circuit_breaker.create_lazy_circuit_breaker("Test API")
+
+        clone = copy.copy(breaker)
+
+        assert clone.name == "Test API"
+        assert not clone.is_initialized
+
+    def test_usable_as_decorator(self, fake_pybreaker):
+        """Test that calling the proxy delegates to the real breaker"""
+        breaker = circuit_breaker.create_lazy_circuit_breaker("Test API")
+
+        def api_call():
+            pass
+
+        decorated = breaker(api_call)
+
+        assert decorated is breaker._breaker.return_value
+        breaker._breaker.assert_called_once_with(api_call)
+
+    def test_failure_threshold_without_building(self, fake_pybreaker):
+        """Test that the configured threshold is readable before first use"""
+        breaker = circuit_breaker.create_lazy_circuit_breaker("Test API", failure_threshold=7)
+
+        assert breaker.failure_threshold == 7
+        fake_pybreaker.assert_not_called()
+
+    def test_returns_none_without_pybreaker(self):
+        """Test graceful degradation when pybreaker is not installed"""
+        with patch.object(circuit_breaker, "CircuitBreaker", None):
+            assert circuit_breaker.create_lazy_circuit_breaker("Test API") is None
+
+
+class TestGetBreakerStatus:
+    """Test the get_breaker_status function"""
+
+    def test_disabled_breaker(self):
+        """Test status for a missing breaker"""
+        status = circuit_breaker.get_breaker_status(None)
+        assert status["available"] is False
+        assert status["state"] == "disabled"
+
+    def test_unused_lazy_breaker_is_not_built(self, fake_pybreaker):
+        """Test that status checks on unused breakers don't create them"""
+        breaker = circuit_breaker.create_lazy_circuit_breaker("Test API", failure_threshold=4)
+
+        status = circuit_breaker.get_breaker_status(breaker)
+
+        assert status["state"] == "closed"
+        assert status["failure_count"] == 0
+        assert status["failure_threshold"] == 4
+        fake_pybreaker.assert_not_called()
+
+    def test_all_statuses_are_read_only(self, fake_pybreaker):
+        """Test that disabled, unused and built breakers all return read-only status"""
+        unused = circuit_breaker.create_lazy_circuit_breaker("Unused API")
+        built = circuit_breaker.create_lazy_circuit_breaker("Built API")
+        built.call
+
+        for breaker in (None, unused, built):
+            with pytest.raises(TypeError):
+                circuit_breaker.get_breaker_status(breaker)["state"] = "open"
+
+
+class TestCallWithBreakerAsync:
+    """Test the call_with_breaker_async function"""
+
+    def test_returns_result(self):
+        """Test that the wrapped call's result is returned"""
+        func = Mock(return_value="ok")
+
+        result = asyncio.run(
+            circuit_breaker.call_with_breaker_async(None, func, "unavailable", 1, key="v")
+        )
+
+        assert result == "ok"
+        func.assert_called_once_with(1, key="v")
+
+    def test_runs_off_the_event_loop_thread(self):
+        """Test that the blocking call runs in a worker thread"""
+        loop_thread = threading.get_ident()
+        seen = []
+
+        asyncio.run(
+            circuit_breaker.call_with_breaker_async(
+                None, lambda: seen.append(threading.get_ident()), "unavailable"
+            )
+        )
+
+        assert seen and seen[0] != loop_thread
+
+    def test_returns_fallback_on_error(self):
+        """Test that errors become the fallback dict"""
+        func = Mock(side_effect=RuntimeError("boom"))
+
+        result = asyncio.run(
+            circuit_breaker.call_with_breaker_async(None, func, "PubMed unavailable")
+        )
+
+        assert result == {"error": "api_error", "message": "PubMed unavailable"}
+
+
+class TestCallManyWithBreakerAsync:
+    """Test the call_many_with_breaker_async function"""
+
+    def test_results_keep_input_order(self):
+        """Test that results line up with the argument tuples"""
+        results = asyncio.run(
+            circuit_breaker.call_many_with_breaker_async(
+                None, lambda x, y: x + y, "unavailable", [(1, 2), (3, 4), (5, 6)]
+            )
+        )
+
+        assert results == [3, 7, 11]
+
+    def test_failure_does_not_cancel_others(self):
+        """Test that one failing call returns its fallback alongside successes"""
+        def search(query):
+            if query == "bad":
+                raise RuntimeError("boom")
+            return f"results for {query}"
+
+        results = asyncio.run(
+            circuit_breaker.call_many_with_breaker_async(
+                None, search, "Search unavailable", [("falls",), ("bad",), ("sepsis",)]
+            )
+        )
+
+        assert results[0] == "results for falls"
+        assert results[1] == {"error": "api_error", "message": "Search unavailable"}
+        assert results[2] == "results for sepsis"
+
+    def test_respects_max_concurrency(self):
+        """Test that no more than max_concurrency calls run at once"""
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def slow_call(i):
+            with lock:
+                active.append(i)
+                peak.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.remove(i)
+            return i
+
+        asyncio.run(
+            circuit_breaker.call_many_with_breaker_async(
+                None, slow_call, "unavailable", [(i,) for i in range(10)], max_concurrency=2
+            )
+        )
+
+        assert max(peak) <= 2
+
+    @pytest.mark.parametrize("max_concurrency", [0, -1])
+    def test_rejects_non_positive_concurrency(self, max_concurrency):
+        """Test that a limit below 1 fails instead of deadlocking the batch"""
+        func = Mock()
+
+        with pytest.raises(ValueError, match="max_concurrency"):
+            asyncio.run(
+                circuit_breaker.call_many_with_breaker_async(
+                    None, func, "unavailable", [(1,)], max_concurrency=max_concurrency
+                )
+            )
+
+        func.assert_not_called()
+
+
+class TestLoggingListener:
+    """Test the LoggingListener event hooks"""
+
+    def test_success_log_is_formatted_lazily(self, caplog):
+        """Test that per-call logs pass arguments instead of pre-formatted text"""
+        listener = circuit_breaker.LoggingListener(timeout=60)
+        cb = Mock()
+        cb.name = "PubMed API"
+
+        with caplog.at_level("DEBUG", logger=circuit_breaker.logger.name):
+            listener.success(cb)
+
+        record = caplog.records[-1]
+        assert record.args == ("PubMed API",)
+        assert record.getMessage() == "Circuit breaker 'PubMed API' - successful call"
+
+
+class TestWithCircuitBreaker:
+    """Test the with_circuit_breaker decorator"""
+
+    def test_error_logged_without_traceback_and_reraised(self, caplog):
+        """Test that ERROR logs skip the traceback and the error propagates"""
+        breaker = Mock()
+        breaker.call.side_effect = ValueError("bad response")
+
+        @circuit_breaker.with_circuit_breaker(breaker, "unavailable")
+        def api_call():
+            pass
+
+        with caplog.at_level("ERROR", logger=circuit_breaker.logger.name):
+            with pytest.raises(ValueError):
+                api_call()
+
+        errors = [r for r in caplog.records if r.levelname == "ERROR"]
+        assert errors
+        assert "ValueError: bad response" in errors[0].getMessage()
+        assert errors[0].exc_info is None
+
+
+@pytest.mark.skipif(circuit_breaker.CircuitBreaker is None, reason="pybreaker not installed")
+class TestCallManyWithOpenBreaker:
+    """Test batch calls against a real open circuit breaker"""
+
+    def _open_breaker(self, reset_timeout):
+        breaker = circuit_breaker.create_circuit_breaker(
+            "Batch API", failure_threshold=1, timeout=reset_timeout
+        )
+        circuit_breaker.call_with_breaker(breaker, Mock(side_effect=RuntimeError("down")), "x")
+        assert breaker.current_state == "open"
+        return breaker
+
+    def test_open_breaker_fails_batch_fast(self):
+        """Test that no call is attempted while the reset timeout runs"""
+        breaker = self._open_breaker(reset_timeout=60)
+        func = Mock(return_value="ok")
+
+        results = asyncio.run(
+            circuit_breaker.call_many_with_breaker_async(
+                breaker, func, "Batch API unavailable", [(i,) for i in range(5)]
+            )
+        )
+
+        func.assert_not_called()
+        assert len(results) == 5
+        assert all(r["error"] == "service_unavailable" for r in results)
+
+    def test_recovered_breaker_runs_remaining_calls(self):
+        """Test that a successful half-open probe lets the batch proceed"""
+        breaker = self._open_breaker(reset_timeout=0)
+        func = Mock(side_effect=lambda i: i * 10)
+
+        results = asyncio.run(
+            circuit_breaker.call_many_with_breaker_async(
+                breaker, func, "Batch API unavailable", [(i,) for i in range(3)]
+            )
+        )
+
+        assert results == [0, 10, 20]
+        assert breaker.current_state == "closed"
+
+
+@pytest.mark.skipif(circuit_breaker.CircuitBreaker is None, reason="pybreaker not installed")
+class TestLazyBreakerDecorator:
+    """Test decorator use of a lazy proxy around a real breaker"""
+
+    def test_decorated_function_runs_through_breaker(self):
+        """Test that @breaker works the same as with a plain CircuitBreaker"""
+        breaker = circuit_breaker.create_lazy_circuit_breaker("Decorated API", failure_threshold=1)
+
+        @breaker
+        def api_call():
+            raise RuntimeError("down")
+
+        with pytest.raises((RuntimeError, circuit_breaker.CircuitBreakerError)):
+            api_call()
+
+        assert breaker.current_state == "open"
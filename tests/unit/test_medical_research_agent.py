@@ -128,6 +128,20 @@ class TestCreateAgent:
 
         mock_get_db.assert_called_with("medical_research")
 
+    @patch('medical_research_agent.Agent')
+    @patch('medical_research_agent.create_pubmed_tools_safe', return_value=None)
+    @patch('medical_research_agent.build_tools_list', return_value=[])
+    def test_create_agent_uses_module_prompts(self, mock_build, mock_pubmed, mock_agent):
+        """Test that the prompt text is the shared module-level constant"""
+        import medical_research_agent
+
+        agent = MedicalResearchAgent()
+        call_kwargs = mock_agent.call_args.kwargs
+
+        assert call_kwargs['description'] is medical_research_agent.MEDICAL_RESEARCH_DESCRIPTION
+        assert call_kwargs['instructions'] is medical_research_agent.MEDICAL_RESEARCH_INSTRUCTIONS
+        assert "PubMed" in call_kwargs['instructions']
+
 
 class TestMedicalResearchAgentIntegration:
     """Integration tests for MedicalResearchAgent"""
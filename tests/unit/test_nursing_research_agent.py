@@ -196,6 +196,21 @@ class TestCreateAgent:
         mock_get_db.assert_called_with("nursing_research")
         mock_sqlite.assert_called_once_with(db_file="/tmp/nursing_research_agent.db")
 
+    @patch('nursing_research_agent.Agent')
+    @patch('nursing_research_agent.create_exa_tools_safe', return_value=None)
+    @patch('nursing_research_agent.create_serp_tools_safe', return_value=None)
+    @patch('nursing_research_agent.build_tools_list', return_value=[])
+    def test_create_agent_uses_module_prompts(self, mock_build, mock_serp, mock_exa, mock_agent):
+        """Test that the prompt text is the shared module-level constant"""
+        import nursing_research_agent
+
+        agent = NursingResearchAgent()
+        call_kwargs = mock_agent.call_args.kwargs
+
+        assert call_kwargs['description'] is nursing_research_agent.NURSING_RESEARCH_DESCRIPTION
+        assert call_kwargs['instructions'] is nursing_research_agent.NURSING_RESEARCH_INSTRUCTIONS
+        assert "PICOT" in call_kwargs['instructions']
+
 
 class TestShowUsageExamples:
     """Test the show_usage_examples method"""